@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
 import os
 
 cinndir = os.path.dirname(os.path.abspath(__file__))
@@ -21,172 +22,201 @@ cuhfile = os.path.join(runtime_include_dir, "cinn_cuda_runtime_source.cuh")
 if os.path.exists(cuhfile):
     os.environ.setdefault('runtime_include_dir', runtime_include_dir)
 
-from .common import (  # noqa: F401
-    BFloat16,
-    Bool,
-    CINNValue,
-    CINNValuePack,
-    DefaultHostTarget,
-    DefaultNVGPUTarget,
-    DefaultTarget,
-    Float,
-    Float16,
-    Int,
-    RefCount,
-    Shared_CINNValuePack_,
-    String,
-    Target,
-    Type,
-    UInt,
-    Void,
-    _CINNValuePack_,
-    get_target,
-    is_compiled_with_cuda,
-    is_compiled_with_cudnn,
-    make_const,
-    reset_name_id,
-    set_target,
-    type_of,
-)
-from .backends import (  # noqa: F401
-    Compiler,
-    ExecutionEngine,
-    ExecutionOptions,
-)
-from .poly import (  # noqa: F401
-    Condition,
-    Iterator,
-    SharedStage,
-    SharedStageMap,
-    Stage,
-    StageMap,
-    create_stages,
-)
-from .ir import (  # noqa: F401
-    Add,
-    And,
-    Args,
-    Argument,
-    BinaryOpNodeAdd,
-    BinaryOpNodeAnd,
-    BinaryOpNodeDiv,
-    BinaryOpNodeEQ,
-    BinaryOpNodeFracOp,
-    BinaryOpNodeGE,
-    BinaryOpNodeGT,
-    BinaryOpNodeLE,
-    BinaryOpNodeLT,
-    BinaryOpNodeMax,
-    BinaryOpNodeMin,
-    BinaryOpNodeMod,
-    BinaryOpNodeMul,
-    BinaryOpNodeNE,
-    BinaryOpNodeOr,
-    BinaryOpNodeSub,
-    Block,
-    Call,
-    CallOp,
-    CallType,
-    Cast,
-    ComputeOp,
-    Div,
-    EQ,
-    Expr,
-    ExprNodeAdd,
-    ExprNodeAnd,
-    ExprNodeBlock,
-    ExprNodeCall,
-    ExprNodeCast,
-    ExprNodeDiv,
-    ExprNodeEQ,
-    ExprNodeFloatImm,
-    ExprNodeFracOp,
-    ExprNodeGE,
-    ExprNodeGT,
-    ExprNodeIntImm,
-    ExprNodeLE,
-    ExprNodeLT,
-    ExprNodeLet,
-    ExprNodeLoad,
-    ExprNodeMax,
-    ExprNodeMin,
-    ExprNodeMinus,
-    ExprNodeMod,
-    ExprNodeMul,
-    ExprNodeNE,
-    ExprNodeNot,
-    ExprNodeOr,
-    ExprNodeProduct,
-    ExprNodeReduce,
-    ExprNodeSelect,
-    ExprNodeStore,
-    ExprNodeStringImm,
-    ExprNodeSub,
-    ExprNodeSum,
-    ExprNodeUIntImm,
-    ExprNode_Module_,
-    ExprNode_Tensor_,
-    ExprNode_Var_,
-    FloatImm,
-    FracOp,
-    GE,
-    GT,
-    IRVisitor,
-    IntImm,
-    IrNode,
-    IrNodeRef,
-    IrNodeTy,
-    LE,
-    LT,
-    Let,
-    Load,
-    LoadStoreAddrMnger,
-    LoweredFunc,
-    Max,
-    Min,
-    Minus,
-    Mod,
-    Mul,
-    NE,
-    Not,
-    Operation,
-    Or,
-    PackedFunc,
-    PlaceholderOp,
-    Product,
-    Reduce,
-    Registry,
-    Select,
-    SharedIrNode,
-    Store,
-    StringImm,
-    Sub,
-    Sum,
-    Tensor,
-    UIntImm,
-    UnaryOpNodeMinus,
-    UnaryOpNodeNot,
-    Var,
-    _Module_,
-    _Tensor_,
-    _Var_,
-)
-from .lang import (  # noqa: F401
-    Buffer,
-    Module,
-    Placeholder,
-    ReturnType,
-    call_extern,
-    call_lowered,
-    compute,
-    create_placeholder,
-    lower,
-    lower_vec,
-    reduce_all,
-    reduce_any,
-    reduce_max,
-    reduce_min,
-    reduce_mul,
-    reduce_sum,
-)
-from .version import full_version as __version__
+from .version import full_version as __version__  # noqa: F401
+
+# The submodules below pull in the CINN C++ extension, an expensive dlopen
+# of the full runtime. Loading them is deferred until one of their symbols
+# is first accessed (PEP 562), so that a bare `import cinn` stays cheap.
+_lazy_imports = {
+    '.common': (
+        'BFloat16',
+        'Bool',
+        'CINNValue',
+        'CINNValuePack',
+        'DefaultHostTarget',
+        'DefaultNVGPUTarget',
+        'DefaultTarget',
+        'Float',
+        'Float16',
+        'Int',
+        'RefCount',
+        'Shared_CINNValuePack_',
+        'String',
+        'Target',
+        'Type',
+        'UInt',
+        'Void',
+        '_CINNValuePack_',
+        'get_target',
+        'is_compiled_with_cuda',
+        'is_compiled_with_cudnn',
+        'make_const',
+        'reset_name_id',
+        'set_target',
+        'type_of',
+    ),
+    '.backends': (
+        'Compiler',
+        'ExecutionEngine',
+        'ExecutionOptions',
+    ),
+    '.poly': (
+        'Condition',
+        'Iterator',
+        'SharedStage',
+        'SharedStageMap',
+        'Stage',
+        'StageMap',
+        'create_stages',
+    ),
+    '.ir': (
+        'Add',
+        'And',
+        'Args',
+        'Argument',
+        'BinaryOpNodeAdd',
+        'BinaryOpNodeAnd',
+        'BinaryOpNodeDiv',
+        'BinaryOpNodeEQ',
+        'BinaryOpNodeFracOp',
+        'BinaryOpNodeGE',
+        'BinaryOpNodeGT',
+        'BinaryOpNodeLE',
+        'BinaryOpNodeLT',
+        'BinaryOpNodeMax',
+        'BinaryOpNodeMin',
+        'BinaryOpNodeMod',
+        'BinaryOpNodeMul',
+        'BinaryOpNodeNE',
+        'BinaryOpNodeOr',
+        'BinaryOpNodeSub',
+        'Block',
+        'Call',
+        'CallOp',
+        'CallType',
+        'Cast',
+        'ComputeOp',
+        'Div',
+        'EQ',
+        'Expr',
+        'ExprNodeAdd',
+        'ExprNodeAnd',
+        'ExprNodeBlock',
+        'ExprNodeCall',
+        'ExprNodeCast',
+        'ExprNodeDiv',
+        'ExprNodeEQ',
+        'ExprNodeFloatImm',
+        'ExprNodeFracOp',
+        'ExprNodeGE',
+        'ExprNodeGT',
+        'ExprNodeIntImm',
+        'ExprNodeLE',
+        'ExprNodeLT',
+        'ExprNodeLet',
+        'ExprNodeLoad',
+        'ExprNodeMax',
+        'ExprNodeMin',
+        'ExprNodeMinus',
+        'ExprNodeMod',
+        'ExprNodeMul',
+        'ExprNodeNE',
+        'ExprNodeNot',
+        'ExprNodeOr',
+        'ExprNodeProduct',
+        'ExprNodeReduce',
+        'ExprNodeSelect',
+        'ExprNodeStore',
+        'ExprNodeStringImm',
+        'ExprNodeSub',
+        'ExprNodeSum',
+        'ExprNodeUIntImm',
+        'ExprNode_Module_',
+        'ExprNode_Tensor_',
+        'ExprNode_Var_',
+        'FloatImm',
+        'FracOp',
+        'GE',
+        'GT',
+        'IRVisitor',
+        'IntImm',
+        'IrNode',
+        'IrNodeRef',
+        'IrNodeTy',
+        'LE',
+        'LT',
+        'Let',
+        'Load',
+        'LoadStoreAddrMnger',
+        'LoweredFunc',
+        'Max',
+        'Min',
+        'Minus',
+        'Mod',
+        'Mul',
+        'NE',
+        'Not',
+        'Operation',
+        'Or',
+        'PackedFunc',
+        'PlaceholderOp',
+        'Product',
+        'Reduce',
+        'Registry',
+        'Select',
+        'SharedIrNode',
+        'Store',
+        'StringImm',
+        'Sub',
+        'Sum',
+        'Tensor',
+        'UIntImm',
+        'UnaryOpNodeMinus',
+        'UnaryOpNodeNot',
+        'Var',
+        '_Module_',
+        '_Tensor_',
+        '_Var_',
+    ),
+    '.lang': (
+        'Buffer',
+        'Module',
+        'Placeholder',
+        'ReturnType',
+        'call_extern',
+        'call_lowered',
+        'compute',
+        'create_placeholder',
+        'lower',
+        'lower_vec',
+        'reduce_all',
+        'reduce_any',
+        'reduce_max',
+        'reduce_min',
+        'reduce_mul',
+        'reduce_sum',
+    ),
+}
+
+_lazy_symbols = {
+    symbol: module
+    for module, symbols in _lazy_imports.items()
+    for symbol in symbols
+}
+
+
+def __getattr__(name):
+    try:
+        module = _lazy_symbols[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache the symbol so subsequent accesses skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_symbols))
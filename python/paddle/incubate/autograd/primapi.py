@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import logging
 import typing
 
@@ -20,6 +21,8 @@ from paddle.fluid import backward, core, framework
 from paddle.fluid.core import prim_config
 from paddle.incubate.autograd import primx, utils
 
+_logger = logging.getLogger(__name__)
+
 
 @framework.static_only
 def forward_grad(outputs, inputs, grad_inputs=None):
@@ -84,20 +87,21 @@ def forward_grad(outputs, inputs, grad_inputs=None):
             f'but got {type(inputs)}.'
         )
 
+    block = framework.default_main_program().current_block()
     ys, xs, xs_dot = (
         utils.as_tensors(outputs),
         utils.as_tensors(inputs),
         utils.as_tensors(grad_inputs),
     )
 
-    block = framework.default_main_program().current_block()
-    if any(x.block != block for x in xs + ys):
+    if any(t.block != block for t in itertools.chain(xs, ys)):
         raise RuntimeError(
             'Variable in inputs and targets should exist in current block of '
             'main program.'
         )
 
-    primx.orig2prim(block)
+    if getattr(block, '_prim_lowered_epoch', -1) != block.desc.op_size():
+        primx.orig2prim(block)
     ad = primx.Transform(ys[0].block)
     _, ys_dot = ad.linearize(xs, ys, xs_dot)
 
@@ -175,22 +179,24 @@ def grad(outputs, inputs, grad_outputs=None):
             f'but got {type(inputs)}.'
         )
 
+    block = framework.default_main_program().current_block()
     ys, xs, ys_bar = (
         utils.as_tensors(outputs),
         utils.as_tensors(inputs),
         utils.as_tensors(grad_outputs),
     )
-    block = framework.default_main_program().current_block()
-    if any((x is not None and x.block != block) for x in xs + ys):
+    if any(
+        (t is not None and t.block != block) for t in itertools.chain(xs, ys)
+    ):
         raise RuntimeError(
             'Variable in inputs and outputs should be None or in current block of main program'
         )
 
-    # TODO(Tongxin) without any prior knowledge about whether the program
-    # is completely lowered to primitive ops, it's mandatory to run the lowering
-    # pass once and again. This is obviously inefficient and needs to be
-    # optimized.
-    primx.orig2prim(block)
+    # orig2prim stamps the block with the op count it saw, so the lowering
+    # pass only reruns when ops have been appended since the last call
+    # (e.g. by a preceding forward_grad on the same program).
+    if getattr(block, '_prim_lowered_epoch', -1) != block.desc.op_size():
+        primx.orig2prim(block)
     ad = primx.Transform(block)
     xs_dot, ys_dot = ad.linearize(xs, ys)
     if any(var is None for var in ys_dot):
@@ -200,10 +206,11 @@ def grad(outputs, inputs, grad_outputs=None):
     ys_bar, xs_bar = ad.transpose(ys_dot, xs_dot, ys_bar)
 
     # remove xs_dot and their constructor ops
+    op_position = {id(op): i for i, op in enumerate(block.ops)}
     op_indexes = []
     for var in xs_dot:
         if var is not None:
-            op_index = block.ops.index(var.op)
+            op_index = op_position.get(id(var.op), -1)
             if op_index < 0:
                 raise ValueError(
                     f'op_index should be greater than or equal to 0, but op_index={op_index}.'
@@ -216,6 +223,20 @@ def grad(outputs, inputs, grad_outputs=None):
     return xs_bar[0] if isinstance(inputs, framework.Variable) else xs_bar
 
 
+# Specialized op filters for to_prim, keyed on (bool(blacklist),
+# bool(whitelist)). Each factory binds the sets it needs as default
+# arguments, so the per-op predicate does not go through closure cells
+# or test an empty set.
+_FILTER_TABLE = {
+    (True, True): lambda bl, wl: (
+        lambda x, _bl=bl, _wl=wl: x.type in _wl and x.type not in _bl
+    ),
+    (True, False): lambda bl, wl: (lambda x, _bl=bl: x.type not in _bl),
+    (False, True): lambda bl, wl: (lambda x, _wl=wl: x.type in _wl),
+    (False, False): lambda bl, wl: (lambda x: True),
+}
+
+
 @framework.static_only
 def to_prim(
     blocks,
@@ -244,11 +265,17 @@ def to_prim(
         logging.info("Atomize composite op to primitive ops begin.")
         main_program = blocks.program
     elif isinstance(blocks, typing.Sequence):
-        for item in blocks:
-            if not isinstance(item, paddle.fluid.framework.Block):
-                raise TypeError(
-                    f"Expect block or sequence of blocks, but sequence contains {type(item)}."
-                )
+        if not all(
+            isinstance(item, paddle.fluid.framework.Block) for item in blocks
+        ):
+            bad = next(
+                item
+                for item in blocks
+                if not isinstance(item, paddle.fluid.framework.Block)
+            )
+            raise TypeError(
+                f"Expect block or sequence of blocks, but sequence contains {type(bad)}."
+            )
         main_program = blocks[0].program
     else:
         raise TypeError(
@@ -263,26 +290,25 @@ def to_prim(
             f'Expected type of whiltelist is set|frozenset, but got {type(whitelist)}.'
         )
 
-    blacklist = prim_config["forward_blacklist"] | blacklist
+    blacklist = frozenset(prim_config["forward_blacklist"] | blacklist)
+    whitelist = frozenset(whitelist)
 
     with framework.program_guard(main_program):
-        print("Lowering composite forward ops begin...", flush=True)
-
-        if len(blacklist) > 0 and len(whitelist) > 0:
-            filter_ = lambda x: x.type in whitelist and x.type not in blacklist
-        elif len(blacklist) > 0 and len(whitelist) == 0:
-            filter_ = lambda x: x.type not in blacklist
-        elif len(blacklist) == 0 and len(whitelist) > 0:
-            filter_ = lambda x: x.type in whitelist
-        else:
-            filter_ = lambda x: True
+        _logger.info("Lowering composite forward ops begin...")
+
+        filter_ = _FILTER_TABLE[(bool(blacklist), bool(whitelist))](
+            blacklist, whitelist
+        )
         primx._lower_composite(
             blocks,
             filter_,
             start_idx=start_idx,
             backward_length=backward_length,
         )
-        replace_ops = prim_config["composite_ops_record"]
-        print(
-            f"Lowering composite forward ops finish: {replace_ops}", flush=True
-        )
+        if _logger.isEnabledFor(logging.INFO):
+            # Guarded so the potentially large record is not stringified
+            # when the message would be dropped anyway.
+            _logger.info(
+                "Lowering composite forward ops finish: %s",
+                prim_config["composite_ops_record"],
+            )
@@ -783,6 +783,10 @@ def orig2prim(block=None):
         block == default_main_program().current_block()
     ), 'block is neither None nor current block of main program'
     _lower(block, reverse=False, blacklist=[])
+    # Record the op count at lowering time so that callers such as
+    # primapi.grad and primapi.forward_grad can skip a redundant pass when
+    # no ops have been appended since the last call.
+    block._prim_lowered_epoch = block.desc.op_size()
 
 
 @framework.static_only
@@ -830,3 +834,6 @@ def prim2orig(block=None, blacklist=None):
     ), 'block is neither None nor current block of main program'
     blacklist = [] if blacklist is None else blacklist
     _lower(block, reverse=True, blacklist=blacklist)
+    # The block holds orig ops again, so invalidate the orig2prim stamp
+    # even if the op count happens to match it.
+    block._prim_lowered_epoch = -1
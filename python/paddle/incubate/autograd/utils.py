@@ -325,6 +325,11 @@ def flatten_and_remove_none(inp):
 def as_tensors(xs):
     if isinstance(xs, framework.Variable):
         return (xs,)
+    elif isinstance(xs, tuple):
+        # Already coerced, e.g. the result of a previous as_tensors call
+        # fed back in by an iterative lowering pass; tuples are immutable
+        # so reuse them instead of building a copy.
+        return xs
     elif isinstance(xs, typing.Sequence):
         return tuple(xs)
     else:
@@ -18,9 +18,20 @@ from paddle.common_ops_import import default_main_program
 from paddle.fluid import core
 from paddle.framework import LayerHelper, in_dynamic_mode
 
+from .fused_transformer import fused_bias_dropout_residual_layer_norm
+
 
 def fused_dropout_add(
-    x, y, p=0.5, training=True, mode='upscale_in_train', name=None
+    x,
+    y,
+    p=0.5,
+    training=True,
+    mode='upscale_in_train',
+    epilogue=None,
+    epilogue_weight=None,
+    epilogue_bias=None,
+    epilogue_eps=1e-5,
+    name=None,
 ):
     r"""
     Fused Dropout and Add.
@@ -43,6 +54,16 @@ def fused_dropout_add(
                 - train: :math:`out = input \times mask + y`
                 - inference: :math:`out = input \times (1.0 - dropout\_prob) + y`
 
+        epilogue (str|None, optional): If set to 'layernorm', layer_norm is applied to the
+            fused result in the same kernel, computing :math:`layer\_norm(dropout(x) + y)`
+            without writing the intermediate sum back to memory. Default: None.
+        epilogue_weight (Tensor, optional): The weight tensor of the layer_norm epilogue.
+            The shape is `[x.shape[-1]]`. Only used when `epilogue` is 'layernorm'. Default: None.
+        epilogue_bias (Tensor, optional): The bias tensor of the layer_norm epilogue.
+            The shape is `[x.shape[-1]]`. Only used when `epilogue` is 'layernorm'. Default: None.
+        epilogue_eps (float, optional): Small float value added to the denominator of the
+            layer_norm epilogue to avoid dividing by zero. Only used when `epilogue` is
+            'layernorm'. Default: 1e-5.
         name (str, optional): Name for the operation, Default: None. For more information, please refer to :ref:`api_guide_Name`.
 
     Returns:
@@ -75,7 +96,7 @@ def fused_dropout_add(
     """
     if isinstance(p, (int, float)):
         # fast return for p == 0
-        if p == 0:
+        if p == 0 and epilogue is None:
             return x + y
         elif p < 0 or p > 1:
             raise ValueError("p argument should between 0 and 1")
@@ -83,10 +104,33 @@ def fused_dropout_add(
         raise ValueError(
             "mode argument should be 'downscale_in_infer' or 'upscale_in_train'"
         )
-    seed = None
+    if epilogue is not None:
+        if epilogue != 'layernorm':
+            raise ValueError("epilogue argument should be None or 'layernorm'")
+        # layer_norm(dropout(x) + y) already exists as a single fused
+        # kernel; route to it so the residual sum never round-trips
+        # through memory before being normalized.
+        return fused_bias_dropout_residual_layer_norm(
+            x,
+            y,
+            ln_scale=epilogue_weight,
+            ln_bias=epilogue_bias,
+            dropout_rate=p,
+            ln_epsilon=epilogue_eps,
+            training=training,
+            mode=mode,
+            name=name,
+        )
+    if not training:
+        # At inference time the op reduces to a plain add (upscale_in_train)
+        # or a scaled add (downscale_in_infer), so skip the fused kernel and
+        # its RNG state bookkeeping entirely.
+        if mode == 'upscale_in_train':
+            return x + y
+        return x * (1.0 - p) + y
     if in_dynamic_mode():
-        if default_main_program().random_seed != 0:
-            seed = default_main_program().random_seed
+        random_seed = default_main_program().random_seed
+        seed, fix_seed = (random_seed, True) if random_seed != 0 else (0, False)
         out, seed_offset = _C_ops.fused_dropout_add(
             x,
             y,
@@ -94,30 +138,26 @@ def fused_dropout_add(
             p,
             not training,
             mode,
-            seed if seed is not None else 0,
-            seed is not None,
+            seed,
+            fix_seed,
         )
         return out
     else:
-        helper = LayerHelper('fused_dropout_add', **locals())
+        helper = LayerHelper('fused_dropout_add', name=name)
         out = helper.create_variable_for_type_inference(dtype=x.dtype)
         seed_offset = helper.create_variable_for_type_inference(
             dtype=core.VarDesc.VarType.INT64, stop_gradient=True
         )
 
-        def get_attrs(prog, dropout_prob, is_test, seed):
-            if (seed is None or seed == 0) and prog.random_seed != 0:
-                seed = prog.random_seed
-            attrs = {
-                'p': dropout_prob,
-                'is_test': is_test,
-                'mode': mode,
-                'seed': seed if seed is not None else 0,
-                'fix_seed': seed is not None,
-            }
-            return attrs
-
-        attrs = get_attrs(helper.main_program, p, not training, seed)
+        random_seed = helper.main_program.random_seed
+        seed, fix_seed = (random_seed, True) if random_seed != 0 else (0, False)
+        attrs = {
+            'p': p,
+            'is_test': not training,
+            'mode': mode,
+            'seed': seed,
+            'fix_seed': fix_seed,
+        }
 
         helper.append_op(
             type='fused_dropout_add',
@@ -184,5 +184,54 @@ class TestFusedDropoutAddStatic(unittest.TestCase):
         self.assertRaises(ValueError, check_raise)
 
 
+@unittest.skipIf(
+    not core.is_compiled_with_cuda(), "core is not compiled with CUDA "
+)
+class TestFusedDropoutAddEpilogue(unittest.TestCase):
+    def setUp(self):
+        self.shape = (2, 80, 128)
+        self.dtype = 'float32'
+        self.epsilon = 1e-05
+
+    def test_layernorm_epilogue(self):
+        paddle.disable_static()
+        paddle.seed(312)
+        x = paddle.randn(self.shape, self.dtype)
+        y = paddle.randn(self.shape, self.dtype)
+        weight = paddle.randn([self.shape[-1]], self.dtype)
+        bias = paddle.randn([self.shape[-1]], self.dtype)
+        # p = 0.0 keeps the result independent of the dropout mask, so the
+        # fused kernel can be compared against the unfused reference.
+        fused_out = fused_dropout_add(
+            x,
+            y,
+            p=0.0,
+            epilogue='layernorm',
+            epilogue_weight=weight,
+            epilogue_bias=bias,
+            epilogue_eps=self.epsilon,
+        )
+        out = paddle.nn.functional.layer_norm(
+            paddle.nn.functional.dropout(x, 0.0) + y,
+            self.shape[-1],
+            weight,
+            bias,
+            self.epsilon,
+        )
+        np.testing.assert_allclose(
+            fused_out.numpy(), out.numpy(), rtol=1e-05, atol=1e-05
+        )
+
+
+class TestFusedDropoutAddEpilogueError(unittest.TestCase):
+    def test_invalid_epilogue(self):
+        def check_raise():
+            x = paddle.randn([2, 8], 'float32')
+            y = paddle.randn([2, 8], 'float32')
+            fused_dropout_add(x, y, p=0.5, epilogue='bogus')
+
+        self.assertRaises(ValueError, check_raise)
+
+
 if __name__ == '__main__':
     unittest.main()